@@ -20,15 +20,146 @@ Set SOCWATCH_DIR environment variable or use --socwatch-dir to specify installat
 
 import os
 import sys
+import signal
+import pickle
+import operator
 import subprocess
-import glob
+import functools
 from pathlib import Path
 from typing import List, Tuple, Dict, Optional
 import time
 import datetime
 import threading
-import tkinter as tk
-from tkinter import filedialog, messagebox
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# tkinter is imported lazily inside the GUI methods so pure --cli runs
+# never pay the Tcl/Tk load cost (tens of ms and ~10 MB on Windows)
+
+# Known SocWatch session-type suffixes (the part after the last underscore).
+# A frozenset membership test on that slice beats a regex scan: one hash
+# lookup per filename, no matcher state machine
+_SESSION_SUFFIXES = frozenset({'extraSession', 'hwSession', 'infoSession', 'osSession'})
+
+
+# Scan manifest cache written into the input folder; keyed by the mtimes of
+# every directory the scan visited so any file added/removed/renamed in the
+# tree invalidates it
+_SCAN_CACHE_NAME = '.socwatch_pp_cache.pkl'
+
+
+def _load_scan_cache(cache_path: str, root_str: str) -> Optional[Dict]:
+    """
+    Load and validate the scan manifest cache.
+
+    The cache is valid only if it was written for the same spelling of the
+    scan root (its directory strings are rooted at that spelling) and every
+    directory recorded at scan time still has the same mtime_ns - creating,
+    deleting or renaming an entry in a scanned directory bumps its mtime
+    and forces a fresh walk.
+
+    Args:
+        cache_path: Path of the manifest pickle
+        root_str: The current invocation's input folder, as a string
+
+    Returns:
+        The cached payload dict, or None if missing, unreadable or stale
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            payload = pickle.load(f)
+        if payload['root'] != root_str:
+            return None
+        if not isinstance(payload['collections'], list) \
+                or not isinstance(payload['file_count'], int):
+            return None
+        for dir_str, mtime_ns in payload['dir_mtimes'].items():
+            if os.stat(dir_str).st_mtime_ns != mtime_ns:
+                return None
+        return payload
+    except (OSError, pickle.PickleError, EOFError, KeyError,
+            AttributeError, TypeError):
+        return None
+
+
+def _save_scan_cache(cache_path: str, root_str: str,
+                     dir_mtimes: Dict[str, int],
+                     collections_list: List[Dict], file_count: int):
+    """
+    Persist the scan manifest. Best-effort: failures are silently ignored
+    and the next run simply rescans.
+    """
+    payload = {
+        'root': root_str,
+        'dir_mtimes': dir_mtimes,
+        'collections': collections_list,
+        'file_count': file_count,
+    }
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Creating the cache file just bumped the root's mtime. Refresh the
+        # recorded value and overwrite in place (which leaves the directory
+        # mtime alone) so the next run's comparison still holds.
+        new_mtime = os.stat(root_str).st_mtime_ns
+        if dir_mtimes.get(root_str) != new_mtime:
+            dir_mtimes[root_str] = new_mtime
+            with open(cache_path, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _has_socwatch(dir_str: str) -> bool:
+    """
+    Check whether a directory directly contains socwatch.exe.
+
+    Memoized so repeated probes of the same candidate directory cost a
+    single filesystem syscall per run. isfile() on the child also returns
+    False for a missing parent, so one probe covers both checks.
+    """
+    return os.path.isfile(os.path.join(dir_str, "socwatch.exe"))
+
+
+def _scan_etl(root, dir_mtimes: Optional[Dict[str, int]] = None):
+    """
+    Recursively scan for SocWatch session files (*Session.etl) using os.scandir.
+
+    Uses an explicit stack of scandir iterators so directory type checks and
+    file sizes come from the cached DirEntry metadata instead of extra stat()
+    calls per entry. Each iterator is closed via the context manager to avoid
+    file descriptor leaks.
+
+    Args:
+        root: Root directory (str or Path) to walk
+        dir_mtimes: When given, records the mtime_ns of every directory
+                    visited (used to validate the scan manifest cache)
+
+    Yields:
+        (dir_str, filename_str, size_bytes) tuples for each matching .etl
+        file, where filename_str has the .etl extension already stripped
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('Session.etl'):
+                            # DirEntry.stat() reuses metadata cached by the
+                            # directory enumeration (no extra syscall on Windows)
+                            yield current, entry.name[:-4], entry.stat().st_size
+                    except OSError:
+                        # Skip entries that disappear or are inaccessible mid-scan
+                        continue
+        except OSError as e:
+            print(f"⚠️  Skipping unreadable directory {current}: {e}")
 
 
 class SocWatchProcessor:
@@ -45,14 +176,36 @@ class SocWatchProcessor:
         """
         self.socwatch_base_dir = self._resolve_socwatch_dir(socwatch_base_dir)
         self.available_versions = []
-        self.selected_version = None
+        self._cached_versions = None  # Memoized discover_socwatch_versions result
+        self.selected_version = None  # Property; also caches the str form
         self.processed_files = []
         self.failed_files = []
         self.start_time = None
         self.use_gui = use_gui
         self.root = None
         self.custom_output_dir = None
-        
+        self.jobs = None  # Number of parallel jobs (None = auto-detect)
+        self.quiet = False  # Suppress the --dry-run collection listing
+        self.no_timestamps = False  # Let socwatch.exe write to the terminal directly
+        self._report_lock = threading.Lock()  # Guards processed/failed lists
+        self._known_dirs = set()  # Output directories already created this run
+        self._mkdir_lock = threading.Lock()  # Guards _known_dirs
+        self._active_procs = set()  # In-flight socwatch.exe Popen handles
+        self._proc_lock = threading.Lock()  # Guards _active_procs
+        self._interrupted = False  # Set on Ctrl-C; workers stop spawning
+        
+    @property
+    def selected_version(self) -> Optional[Path]:
+        """The socwatch.exe Path currently selected for processing."""
+        return self._selected_version
+
+    @selected_version.setter
+    def selected_version(self, value: Optional[Path]):
+        self._selected_version = value
+        # Cache the string form once per selection so the per-collection
+        # command build and log lines don't re-stringify the same Path
+        self._selected_version_str = str(value) if value is not None else None
+
     def _resolve_socwatch_dir(self, socwatch_base_dir: Optional[str]) -> Path:
         """
         Resolve SocWatch base directory from various sources.
@@ -101,16 +254,19 @@ class SocWatchProcessor:
         ]
         
         for path in common_paths:
-            if path.exists():
-                # Check if socwatch.exe exists directly in the path
-                if (path / "socwatch.exe").exists():
-                    print(f"✅ Auto-detected SocWatch directory: {path}")
-                    return path
-                # Check if socwatch.exe exists in any subdirectory
+            # Check if socwatch.exe exists directly in the path
+            if _has_socwatch(str(path)):
+                print(f"✅ Auto-detected SocWatch directory: {path}")
+                return path
+            # Check if socwatch.exe exists in any subdirectory; the OSError
+            # guard doubles as the directory-existence check
+            try:
                 for item in path.iterdir():
-                    if item.is_dir() and (item / "socwatch.exe").exists():
+                    if item.is_dir() and _has_socwatch(str(item)):
                         print(f"✅ Auto-detected SocWatch directory: {path}")
                         return path
+            except OSError:
+                continue
         
         # 4. Default fallback (original hardcoded path)
         default_path = Path("D:/socwatch")
@@ -122,29 +278,46 @@ class SocWatchProcessor:
         """
         Discover available SocWatch versions in the base directory.
         
+        The result is idempotent for a run, so it is discovered once and
+        memoized for repeat calls.
+
         Returns:
             List of paths to socwatch.exe files
         """
+        if self._cached_versions is not None:
+            return self._cached_versions
+
         versions = []
         if not self.socwatch_base_dir.exists():
             print(f"❌ SocWatch base directory not found: {self.socwatch_base_dir}")
             return versions
             
-        # Look for socwatch.exe in subdirectories
-        for item in self.socwatch_base_dir.iterdir():
-            if item.is_dir():
-                socwatch_exe = item / "socwatch.exe"
-                if socwatch_exe.exists():
-                    versions.append(socwatch_exe)
-                    
+        # Look for socwatch.exe in subdirectories; scandir answers is_dir()
+        # from the cached directory entry instead of a stat per child
+        with os.scandir(self.socwatch_base_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    exe = os.path.join(entry.path, "socwatch.exe")
+                    if os.path.isfile(exe):
+                        versions.append(Path(exe))
+
         # Also check the base directory itself
         base_socwatch = self.socwatch_base_dir / "socwatch.exe"
         if base_socwatch.exists():
             versions.append(base_socwatch)
             
         self.available_versions = sorted(versions)
+        self._cached_versions = self.available_versions
         return self.available_versions
     
+    def _ensure_root(self):
+        """Create (and hide) the shared tkinter root window on first use."""
+        import tkinter as tk
+
+        if not self.root:
+            self.root = tk.Tk()
+            self.root.withdraw()  # Hide the main window
+
     def select_folder_gui(self) -> Path:
         """
         Show GUI folder selection dialog.
@@ -154,12 +327,11 @@ class SocWatchProcessor:
         """
         if not self.use_gui:
             return None
-            
-        # Create root window if it doesn't exist
-        if not self.root:
-            self.root = tk.Tk()
-            self.root.withdraw()  # Hide the main window
-            
+
+        from tkinter import filedialog
+
+        self._ensure_root()
+
         # Show folder selection dialog
         folder_path = filedialog.askdirectory(
             title="Select folder containing SocWatch .etl files",
@@ -185,9 +357,8 @@ class SocWatchProcessor:
         if not versions:
             error_msg = f"No SocWatch installations found!\nPlease ensure socwatch.exe exists in or under: {self.socwatch_base_dir}"
             if self.use_gui:
-                if not self.root:
-                    self.root = tk.Tk()
-                    self.root.withdraw()
+                from tkinter import messagebox
+                self._ensure_root()
                 messagebox.showerror("SocWatch Not Found", error_msg)
             else:
                 print("❌ " + error_msg.replace('\n', '\n   '))
@@ -207,10 +378,10 @@ class SocWatchProcessor:
     
     def _select_version_gui(self, versions: List[Path]) -> bool:
         """GUI version of version selection."""
-        if not self.root:
-            self.root = tk.Tk()
-            self.root.withdraw()
-            
+        import tkinter as tk
+
+        self._ensure_root()
+
         # Create selection dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Select SocWatch Version")
@@ -348,133 +519,253 @@ class SocWatchProcessor:
                 print("\n❌ Selection cancelled")
                 return False
     
-    def find_etl_files(self, input_folder: Path) -> List[Dict]:
+    def iter_collections(self, input_folder: Path):
         """
-        Recursively find all .etl files and group them by SocWatch collections.
-        
+        Stream SocWatch collections as the scan discovers them.
+
+        _scan_etl yields all session files of a directory consecutively, so
+        every collection in a directory is complete as soon as the scanner
+        moves on to the next one. Yielding collections immediately lets
+        processing start before the crawl finishes and keeps memory
+        proportional to one directory instead of the whole tree.
+
+        Collections whose summary/wakeup CSVs already exist are recorded in
+        processed_files and not yielded.
+
+        A manifest of the previous scan is cached in the input folder; when
+        no directory's mtime has changed since then, the walk is skipped
+        entirely and collections are replayed from the cache (any change
+        anywhere triggers a full rescan - no partial invalidation).
+
         Args:
             input_folder: Root folder to search
-            
-        Returns:
-            List of collection info dicts
+
+        Yields:
+            Collection info dicts ready for process_collection
         """
         if not input_folder.exists():
             print(f"❌ Input folder not found: {input_folder}")
-            return []
-            
+            return
+
+        input_root = str(input_folder)
+        cache_path = os.path.join(input_root, _SCAN_CACHE_NAME)
+        cached = _load_scan_cache(cache_path, input_root)
+        if cached is not None:
+            print(f"📦 Reusing cached scan manifest for: {input_folder}")
+            file_count = cached['file_count']
+            pending_count = 0
+            skipped_count = 0
+            # Re-apply the skip check: summaries in a custom output directory
+            # live outside the scanned tree, so their appearance doesn't
+            # invalidate the cache
+            for collection in cached['collections']:
+                if (os.path.exists(collection['summary_csv'])
+                        or os.path.exists(collection['summary_csv_alt'])
+                        or os.path.exists(collection['wakeup_csv'])):
+                    skipped_count += 1
+                    with self._report_lock:
+                        self.processed_files.append(collection)
+                else:
+                    pending_count += 1
+                    yield collection
+            print(f"🔍 Found {file_count} SocWatch session files "
+                  f"({pending_count} pending collection(s))")
+            if skipped_count:
+                print(f"⏭️  Skipping {skipped_count} already-processed collection(s)")
+            return
+
         print(f"🔍 Scanning for SocWatch session files in: {input_folder}")
-        
-        # Use glob to recursively find SocWatch session files (ending with "Session.etl")
+
+        collections = {}  # Collections of the directory currently being scanned
+        current_dir = None
+        file_count = 0
+        pending_count = 0
+        skipped_count = 0
+        dir_mtimes = {}  # Directory mtimes backing the scan manifest cache
+        all_collections = []  # Every collection (skipped included), for the cache
+        scan_ok = True
+
+        def _flush_directory():
+            """Finalize and yield the completed collections of one directory."""
+            nonlocal pending_count, skipped_count
+            # Largest first (LPT scheduling) so parallel workers pick up the
+            # big traces early. Streaming limits the sort to one directory's
+            # batch; a global largest-first order would require materializing
+            # the whole scan (find_etl_files still does that for --dry-run).
+            ordered = sorted(collections.values(),
+                             key=operator.itemgetter('total_size'), reverse=True)
+            for collection in ordered:
+                # Presort session files once so reporting paths don't re-sort.
+                # itemgetter runs in C - no Python frame per comparison key.
+                collection['files'].sort(key=operator.itemgetter('filename'))
+
+                # Hoist the skip-check paths for process_collection to reuse.
+                # Plain strings: os.path.exists on them skips the Path
+                # division and object construction per check.
+                prefix = f"{collection['directory']}{os.sep}{collection['base_name']}"
+                collection['summary_csv'] = prefix + ".csv"
+                collection['summary_csv_alt'] = prefix + "_summary.csv"
+                collection['wakeup_csv'] = prefix + "_WakeupAnalysis.csv"
+
+                all_collections.append(collection)
+
+                # Drop collections already processed in place, so reruns don't
+                # dispatch work that would only be skipped later
+                if (os.path.exists(collection['summary_csv'])
+                        or os.path.exists(collection['summary_csv_alt'])
+                        or os.path.exists(collection['wakeup_csv'])):
+                    skipped_count += 1
+                    with self._report_lock:
+                        self.processed_files.append(collection)
+                else:
+                    pending_count += 1
+                    yield collection
+            collections.clear()
+
         try:
-            pattern = str(input_folder / "**" / "*Session.etl")
-            print(f"🔍 Search pattern: {pattern}")
-            all_etl_files = [Path(f) for f in glob.glob(pattern, recursive=True)]
-            print(f"🔍 Raw glob results: {len(all_etl_files)} SocWatch session files found")
+            for dir_str, filename, etl_size in _scan_etl(input_folder, dir_mtimes):
+                # A new directory means the previous one is fully scanned
+                if dir_str != current_dir:
+                    yield from _flush_directory()
+                    current_dir = dir_str
+
+                file_count += 1
+
+                # Detect SocWatch session types: slice off the tail after the
+                # last underscore and hash it against the known suffix set
+                cut = filename.rfind('_')
+                is_session_file = cut != -1 and filename[cut + 1:] in _SESSION_SUFFIXES
+                base_name = filename[:cut] if is_session_file else filename
+
+                # Group by directory and base name (plain string concat - no Path
+                # allocation in the hot loop)
+                collection_key = dir_str + os.sep + base_name
+
+                # One dict lookup for the hit case instead of a membership
+                # test plus a lookup per field access
+                info = collections.get(collection_key)
+                if info is None:
+                    info = collections[collection_key] = {
+                        'directory': Path(dir_str),
+                        'base_name': base_name,
+                        'files': [],
+                        'total_size': 0,
+                        'is_collection': False
+                    }
+
+                # Add file info (size came from the scandir DirEntry - no
+                # re-stat). Sizes stay integer bytes; MB conversion happens
+                # once at print time instead of per file.
+                info['files'].append({
+                    'path': Path(dir_str + os.sep + filename + '.etl'),
+                    'filename': filename,
+                    'size_bytes': etl_size
+                })
+                info['total_size'] += etl_size
+
+                # Mark as collection if we found session files, or incrementally
+                # as soon as a second file shares the base name - no second pass
+                # over the files at flush time
+                if is_session_file or len(info['files']) > 1:
+                    info['is_collection'] = True
         except Exception as e:
+            scan_ok = False
             print(f"❌ Error during file search: {e}")
-            return []
-        
-        # Group SocWatch session files by directory and detect collections
-        collections = {}
-        
-        for etl_file in all_etl_files:
-            directory = etl_file.parent
-            filename = etl_file.stem
-            
-            # Detect SocWatch session types (all files now end with "Session")
-            session_types = ['_extraSession', '_hwSession', '_infoSession', '_osSession']
-            base_name = filename
-            is_session_file = True  # All files are session files now
-            
-            # Extract base name by removing session type suffix
-            for session_type in session_types:
-                if filename.endswith(session_type):
-                    base_name = filename[:-len(session_type)]
-                    break
-            
-            # Group by directory and base name
-            collection_key = str(directory / base_name)
-            
-            if collection_key not in collections:
-                collections[collection_key] = {
-                    'directory': directory,
-                    'base_name': base_name,
-                    'files': [],
-                    'total_size': 0,
-                    'is_collection': False
-                }
-            
-            # Add file info
-            file_size = etl_file.stat().st_size / (1024 * 1024)  # Size in MB
-            collections[collection_key]['files'].append({
-                'path': etl_file,
-                'filename': filename,
-                'size': file_size
-            })
-            collections[collection_key]['total_size'] += file_size
-            
-            # Mark as collection if we found session files
-            if is_session_file:
-                collections[collection_key]['is_collection'] = True
-        
-        # Convert to processing list
-        processing_list = []
-        for collection_info in collections.values():
-            # If multiple files with same base name, it's likely a collection
-            if len(collection_info['files']) > 1:
-                collection_info['is_collection'] = True
-            
-            processing_list.append(collection_info)
-        
-        print(f"🔍 Found {len(all_etl_files)} SocWatch session files in {len(processing_list)} collection(s)")
-        
-        # Print detailed list of found collections
-        if processing_list:
+
+        yield from _flush_directory()
+
+        if scan_ok:
+            _save_scan_cache(cache_path, input_root, dir_mtimes,
+                             all_collections, file_count)
+
+        print(f"🔍 Found {file_count} SocWatch session files "
+              f"({pending_count} pending collection(s))")
+        if skipped_count:
+            print(f"⏭️  Skipping {skipped_count} already-processed collection(s)")
+        if not file_count:
+            print("❌ No SocWatch session files (*Session.etl) found in the specified directory and its subdirectories")
+
+    def find_etl_files(self, input_folder: Path) -> List[Dict]:
+        """
+        Recursively find all .etl files and group them by SocWatch collections.
+
+        Materializes the iter_collections stream - used by the --dry-run
+        reporting path; the processing path consumes the stream directly.
+
+        Args:
+            input_folder: Root folder to search
+
+        Returns:
+            List of collection info dicts
+        """
+        processing_list = list(self.iter_collections(input_folder))
+
+        # Global largest-first order (LPT scheduling) for the listing; the
+        # streaming path approximates this per directory in _flush_directory
+        processing_list.sort(key=operator.itemgetter('total_size'), reverse=True)
+
+        # Print detailed list of found collections (skipped with --quiet).
+        # Each collection's lines are joined into one stdout write instead of
+        # a flush-per-print, which dominates on large batches.
+        if processing_list and not self.quiet:
             print("\n📋 Detected SocWatch collections:")
             print("=" * 50)
             for i, collection in enumerate(processing_list, 1):
+                lines = []
                 try:
                     relative_path = collection['directory'].relative_to(input_folder)
                     if collection['is_collection']:
-                        print(f"  {i:2d}. {collection['base_name']} (Collection)")
-                        print(f"      📁 Location: {collection['directory']}")
-                        print(f"      📏 Total size: {collection['total_size']:.1f} MB")
-                        print(f"      🏷️  Base prefix: {collection['base_name']}")
-                        print(f"      📚 Session files:")
-                        for file_info in sorted(collection['files'], key=lambda x: x['filename']):
-                            print(f"         - {file_info['filename']}.etl ({file_info['size']:.1f} MB)")
+                        lines.append(f"  {i:2d}. {collection['base_name']} (Collection)")
+                        lines.append(f"      📁 Location: {collection['directory']}")
+                        lines.append(f"      📏 Total size: {collection['total_size'] / 1048576:.1f} MB")
+                        lines.append(f"      🏷️  Base prefix: {collection['base_name']}")
+                        lines.append(f"      📚 Session files:")
+                        for file_info in collection['files']:
+                            lines.append(f"         - {file_info['filename']}.etl ({file_info['size_bytes'] / 1048576:.1f} MB)")
                     else:
                         file_info = collection['files'][0]
-                        print(f"  {i:2d}. {relative_path / (file_info['filename'] + '.etl')}")
-                        print(f"      📁 Location: {collection['directory']}")
-                        print(f"      📏 Size: {file_info['size']:.1f} MB")
-                        print(f"      🏷️  Prefix: {file_info['filename']}")
+                        lines.append(f"  {i:2d}. {relative_path / (file_info['filename'] + '.etl')}")
+                        lines.append(f"      📁 Location: {collection['directory']}")
+                        lines.append(f"      📏 Size: {file_info['size_bytes'] / 1048576:.1f} MB")
+                        lines.append(f"      🏷️  Prefix: {file_info['filename']}")
                 except Exception as e:
-                    print(f"  {i:2d}. {collection['base_name']} (Error reading details: {e})")
+                    lines.append(f"  {i:2d}. {collection['base_name']} (Error reading details: {e})")
+                sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
             print("=" * 50)
-        else:
-            print("❌ No SocWatch session files (*Session.etl) found in the specified directory and its subdirectories")
-            
+
         return processing_list
-    
 
-    def process_collection(self, collection: Dict) -> bool:
+
+    def process_collection(self, collection: Dict,
+                           log: Optional[List[str]] = None) -> Tuple[Dict, bool, Optional[str]]:
         """
         Process a SocWatch collection using socwatch.exe.
-        
+
+        Stateless with respect to the result lists: the outcome is returned
+        to the caller, which aggregates processed/failed collections as the
+        worker futures complete.
+
         Args:
             collection: Dictionary containing collection info
-            
+            log: When given, progress lines are buffered here instead of
+                 printed, so parallel workers don't interleave output
+
         Returns:
-            True if processing successful, False otherwise
+            (collection, ok, error) tuple; error is None on success
         """
+        emit = log.append if log is not None else print
+
         if not self.selected_version:
-            print("❌ No SocWatch version selected")
-            return False
+            emit("❌ No SocWatch version selected")
+            return collection, False, "No SocWatch version selected"
             
         # Get collection info
         base_name = collection['base_name']
         collection_dir = collection['directory']
+        # Convert to string once; every later use (paths, prints, cwd=) is
+        # string-space, so repeated str(Path) round-trips are avoided
+        collection_dir_str = str(collection_dir)
         
         # Determine output directory
         if self.custom_output_dir:
@@ -488,7 +779,7 @@ class SocWatchProcessor:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             
             collection_output_dir = self.custom_output_dir / f"{parent_folder}_{timestamp}" / unique_name
-            print(f"   📁 Unique output: {unique_name}")
+            emit(f"   📁 Unique output: {unique_name}")
         else:
             # Use default: same location as input files (no subfolder)
             collection_output_dir = collection_dir
@@ -498,186 +789,301 @@ class SocWatchProcessor:
         
         # Check 1: Source directory for existing summary files
         # Check for both naming patterns: {base_name}.csv and {base_name}_summary.csv
-        source_summary_csv = collection_dir / f"{base_name}.csv"
-        source_summary_csv_alt = collection_dir / f"{base_name}_summary.csv"
-        source_wakeup_csv = collection_dir / f"{base_name}_WakeupAnalysis.csv"
-        
-        if source_summary_csv.exists():
-            skip_reasons.append(f"source summary file: {source_summary_csv.name}")
-        elif source_summary_csv_alt.exists():
-            skip_reasons.append(f"source summary file: {source_summary_csv_alt.name}")
-        elif source_wakeup_csv.exists():
-            skip_reasons.append(f"wakeup analysis file: {source_wakeup_csv.name}")
+        # (paths were hoisted into the collection dict during scanning)
+        source_summary_csv = collection['summary_csv']
+        source_summary_csv_alt = collection['summary_csv_alt']
+        source_wakeup_csv = collection['wakeup_csv']
+
+        if os.path.exists(source_summary_csv):
+            skip_reasons.append(f"source summary file: {os.path.basename(source_summary_csv)}")
+        elif os.path.exists(source_summary_csv_alt):
+            skip_reasons.append(f"source summary file: {os.path.basename(source_summary_csv_alt)}")
+        elif os.path.exists(source_wakeup_csv):
+            skip_reasons.append(f"wakeup analysis file: {os.path.basename(source_wakeup_csv)}")
         
         # Check 2: Output directory (if using custom output)
         if self.custom_output_dir:
-            output_summary_csv = collection_output_dir / f"{base_name}.csv"
-            output_wakeup_csv = collection_output_dir / f"{base_name}_WakeupAnalysis.csv"
-            if output_summary_csv.exists():
-                skip_reasons.append(f"output summary file: {output_summary_csv.name}")
-            elif output_wakeup_csv.exists():
-                skip_reasons.append(f"output wakeup analysis: {output_wakeup_csv.name}")
+            output_summary_csv = f"{collection_output_dir}{os.sep}{base_name}.csv"
+            output_wakeup_csv = f"{collection_output_dir}{os.sep}{base_name}_WakeupAnalysis.csv"
+            if os.path.exists(output_summary_csv):
+                skip_reasons.append(f"output summary file: {os.path.basename(output_summary_csv)}")
+            elif os.path.exists(output_wakeup_csv):
+                skip_reasons.append(f"output wakeup analysis: {os.path.basename(output_wakeup_csv)}")
         
         # Skip if already processed anywhere
         if skip_reasons:
             reason_text = " and ".join(skip_reasons)
-            print(f"   ⏭️  Skipping - already processed (found {reason_text})")
-            self.processed_files.append(collection)
-            return True
+            emit(f"   ⏭️  Skipping - already processed (found {reason_text})")
+            return collection, True, None
         
         # Use full path to base name for input (directory + base_name)
-        full_input_path = str(collection_dir / base_name)
+        full_input_path = f"{collection_dir_str}{os.sep}{base_name}"
         
-        # Create output directory
+        # Create output directory, skipping the mkdir syscall for targets
+        # already created earlier in this run
         output_dir = str(collection_output_dir)
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        with self._mkdir_lock:
+            if output_dir not in self._known_dirs:
+                Path(output_dir).mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(output_dir)
         
         # Build socwatch command
+        socwatch_exe = self._selected_version_str
         cmd = [
-            str(self.selected_version),
+            socwatch_exe,
             "-i", full_input_path,
             "-o", output_dir
         ]
         
         if collection['is_collection']:
-            print(f"📊 Processing collection: {base_name}")
-            print(f"   📚 Session files: {', '.join([f['filename'] + '.etl' for f in collection['files']])}")
+            emit(f"📊 Processing collection: {base_name}")
+            emit(f"   📚 Session files: {', '.join(f['filename'] + '.etl' for f in collection['files'])}")
         else:
-            print(f"📊 Processing: {collection['files'][0]['filename']}.etl")
+            emit(f"📊 Processing: {collection['files'][0]['filename']}.etl")
         
-        print(f"   📁 Working directory: {collection_dir}")
-        print(f"   🔧 SocWatch executable: {self.selected_version}")
-        print(f"   📝 Input full path: {full_input_path}")
-        print(f"   📤 Output directory: {output_dir}")
-        print(f"   ⚡ Full command:")
-        print(f"      {self.selected_version}")
-        print(f"      -i {full_input_path}")
-        print(f"      -o {output_dir}")
+        emit(f"   📁 Working directory: {collection_dir_str}")
+        emit(f"   🔧 SocWatch executable: {socwatch_exe}")
+        emit(f"   📝 Input full path: {full_input_path}")
+        emit(f"   📤 Output directory: {output_dir}")
+        emit(f"   ⚡ Full command:")
+        emit(f"      {socwatch_exe}")
+        emit(f"      -i {full_input_path}")
+        emit(f"      -o {output_dir}")
         
         # Validate command before execution
-        if not Path(self.selected_version).exists():
-            print(f"   ❌ Error: SocWatch executable not found: {self.selected_version}")
-            self.failed_files.append((collection, f"SocWatch executable not found: {self.selected_version}"))
-            return False
+        if not os.path.exists(socwatch_exe):
+            emit(f"   ❌ Error: SocWatch executable not found: {socwatch_exe}")
+            return collection, False, f"SocWatch executable not found: {socwatch_exe}"
             
+        if self._interrupted:
+            emit(f"   ⚠️  Skipped - run interrupted")
+            return collection, False, "Interrupted"
+
         try:
-            # Change to the collection directory where .etl files are located
-            original_cwd = os.getcwd()
-            os.chdir(collection_dir)
-            
             # Run socwatch.exe with extended timeout and real-time output logging
-            print(f"   🚀 Starting SocWatch processing (may take several minutes for large files)...")
-            print(f"   📝 SocWatch Output Log:")
-            print(f"      " + "=" * 60)
+            emit(f"   🚀 Starting SocWatch processing (may take several minutes for large files)...")
+
+            if self.no_timestamps:
+                # SocWatch inherits our stdout: no pipe, and none of the
+                # output passes through Python at all. Same process-group
+                # setup as the piped path so a timeout kills helper children
+                # too, not just the direct child.
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=collection_dir_str,
+                    creationflags=(subprocess.CREATE_NEW_PROCESS_GROUP
+                                   if os.name == 'nt' else 0),
+                    start_new_session=(os.name != 'nt')
+                )
+                with self._proc_lock:
+                    self._active_procs.add(process)
+                # Close the race with the interrupt sweep: a worker that
+                # spawned after the sweep ran kills its own child here
+                if self._interrupted:
+                    self._kill_process_tree(process)
+                try:
+                    return_code = process.wait(timeout=1800)  # 30 minute timeout
+                except subprocess.TimeoutExpired:
+                    self._kill_process_tree(process)
+                    raise
+                except Exception:
+                    process.kill()
+                    raise
+                finally:
+                    with self._proc_lock:
+                        self._active_procs.discard(process)
+                return self._record_result(collection, return_code, [], output_dir, log)
+
+            emit(f"   📝 SocWatch Output Log:")
+            emit(f"      " + "=" * 60)
             
-            # Start subprocess with real-time output
+            # Start subprocess with real-time output, running in the
+            # collection directory where the .etl files are located
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=-1,  # Default block buffering - readline() is served
+                             # from the buffer, not a syscall per line
+                cwd=collection_dir_str,
+                # Give socwatch.exe its own process group/session so timeout
+                # cleanup can take down any children it spawned as well
+                creationflags=(subprocess.CREATE_NEW_PROCESS_GROUP
+                               if os.name == 'nt' else 0),
+                start_new_session=(os.name != 'nt')
             )
             
-            # Log output with timestamps in real-time
-            output_lines = []
+            # Drain output with timestamps on a background thread so the main
+            # thread can enforce the timeout with a single blocking wait()
+            # instead of a poll() syscall per line. Only the tail is kept:
+            # error reporting never looks further back, and an unbounded
+            # list would hold a long run's entire output per worker.
+            output_lines = deque(maxlen=500)
+            t0_mono = time.monotonic()
+
+            def _drain(stream):
+                for line in stream:
+                    # Elapsed HH:MM:SS.mmm from integer math - far cheaper
+                    # than a datetime.now().strftime() per output line
+                    ms = int((time.monotonic() - t0_mono) * 1000)
+                    timestamp = f"{ms // 3600000:02d}:{(ms // 60000) % 60:02d}:{(ms // 1000) % 60:02d}.{ms % 1000:03d}"
+                    output_line = line.strip()
+                    output_lines.append(output_line)
+                    emit(f"      [{timestamp}] {output_line}")
+
+            drain_thread = threading.Thread(target=_drain, args=(process.stdout,), daemon=True)
+            drain_thread.start()
+
+            with self._proc_lock:
+                self._active_procs.add(process)
+            # Close the race with the interrupt sweep: a worker that spawned
+            # after the sweep ran kills its own child here
+            if self._interrupted:
+                self._kill_process_tree(process)
             try:
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
-                        output_line = output.strip()
-                        output_lines.append(output_line)
-                        print(f"      [{timestamp}] {output_line}")
-                
-                # Wait for process to complete with timeout
-                try:
-                    return_code = process.wait(timeout=1800)  # 30 minute timeout
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    raise subprocess.TimeoutExpired(cmd, 1800)
-                    
-            except Exception as e:
+                return_code = process.wait(timeout=1800)  # 30 minute timeout
+            except subprocess.TimeoutExpired:
+                self._kill_process_tree(process)
+                # Let the drain thread hit EOF on the killed process's pipe
+                # before the caller touches the log; otherwise it keeps
+                # appending after the timeout message (bounded join - don't
+                # hang on a pipe a grandchild still holds open)
+                drain_thread.join(timeout=5)
+                raise
+            except Exception:
                 process.kill()
-                raise e
-            
-            print(f"      " + "=" * 60)
-            
-            # Restore original directory
-            os.chdir(original_cwd)
+                raise
+            finally:
+                with self._proc_lock:
+                    self._active_procs.discard(process)
+
+            # Collect any output still buffered after process exit
+            drain_thread.join()
             
-            if return_code == 0:
-                print(f"   ✅ Success")
-                self.processed_files.append(collection)
-                return True
-            else:
-                print(f"   ❌ Failed (exit code: {return_code})")
-                
-                # Show detailed error information
-                if output_lines:
-                    print(f"   📋 Last 15 output lines:")
-                    for line in output_lines[-15:]:
-                        print(f"      {line}")
-                    
-                    # Check for common error patterns
-                    error_summary = []
-                    for line in output_lines:
-                        line_lower = line.lower()
-                        if any(keyword in line_lower for keyword in ['error', 'failed', 'exception', 'access denied', 'permission']):
-                            error_summary.append(line)
-                    
-                    if error_summary:
-                        print(f"   ⚠️  Error indicators found:")
-                        for error_line in error_summary[-5:]:  # Show last 5 error lines
-                            print(f"      ⚠️  {error_line}")
-                    
-                    # Check output directory write permission
-                    try:
-                        test_file = Path(output_dir) / ".write_test"
-                        test_file.touch()
-                        test_file.unlink()
-                        print(f"   ✓ Output directory write test: PASSED")
-                    except Exception as perm_error:
-                        print(f"   ❌ Output directory write test: FAILED - {perm_error}")
-                        error_summary.append(f"Write permission issue: {perm_error}")
-                    
-                    error_output = f"Exit code {return_code}. " + ('\n'.join(error_summary) if error_summary else '\n'.join(output_lines[-10:]))
-                else:
-                    error_output = f"Exit code {return_code}. No output captured"
-                    print(f"   📋 No output captured from SocWatch")
-                
-                self.failed_files.append((collection, error_output))
-                return False
-                
+            emit(f"      " + "=" * 60)
+
+            return self._record_result(collection, return_code, output_lines, output_dir, log)
+
         except subprocess.TimeoutExpired:
-            print(f"   ❌ Timeout (>30 minutes)")
-            self.failed_files.append((collection, "Timeout"))
-            return False
+            emit(f"   ❌ Timeout (>30 minutes)")
+            return collection, False, "Timeout"
         except Exception as e:
-            print(f"   ❌ Error: {e}")
-            self.failed_files.append((collection, str(e)))
-            return False
-        finally:
-            # Ensure we're back in original directory
-            os.chdir(original_cwd)
-    
-    def process_all_files(self, input_folder: Path) -> None:
+            emit(f"   ❌ Error: {e}")
+            return collection, False, str(e)
+
+    @staticmethod
+    def _kill_process_tree(process):
+        """
+        Terminate a timed-out socwatch.exe together with its children.
+
+        process.kill() alone only reaches the direct child; socwatch.exe
+        helpers it spawned would keep running (and keep the .etl files
+        locked on Windows). The child was started in its own process
+        group/session, so the whole group can be signalled.
+        """
+        try:
+            if os.name == 'nt':
+                os.kill(process.pid, signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            process.kill()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def _kill_active_processes(self):
+        """Kill every socwatch.exe run still in flight (interrupt cleanup)."""
+        with self._proc_lock:
+            active = list(self._active_procs)
+        for process in active:
+            self._kill_process_tree(process)
+
+    def _record_result(self, collection: Dict, return_code: int,
+                       output_lines: List[str], output_dir: str,
+                       log: Optional[List[str]] = None) -> Tuple[Dict, bool, Optional[str]]:
+        """
+        Summarize the outcome of a finished socwatch.exe run.
+
+        Shared by the timestamped (piped) and --no-timestamps (inherited
+        stdout) execution paths.
+
+        Args:
+            collection: Collection that was processed
+            return_code: socwatch.exe exit code
+            output_lines: Captured output lines (empty when stdout was inherited)
+            output_dir: Output directory used for the run
+            log: Buffer for progress lines (see process_collection)
+
+        Returns:
+            (collection, ok, error) tuple; error is None on success
+        """
+        emit = log.append if log is not None else print
+
+        if return_code == 0:
+            emit(f"   ✅ Success")
+            return collection, True, None
+
+        emit(f"   ❌ Failed (exit code: {return_code})")
+
+        # Show detailed error information
+        output_lines = list(output_lines)  # May arrive as a bounded deque
+        if output_lines:
+            emit(f"   📋 Last 15 output lines:")
+            for line in output_lines[-15:]:
+                emit(f"      {line}")
+
+            # Check for common error patterns
+            error_summary = []
+            for line in output_lines:
+                line_lower = line.lower()
+                if any(keyword in line_lower for keyword in ['error', 'failed', 'exception', 'access denied', 'permission']):
+                    error_summary.append(line)
+
+            if error_summary:
+                emit(f"   ⚠️  Error indicators found:")
+                for error_line in error_summary[-5:]:  # Show last 5 error lines
+                    emit(f"      ⚠️  {error_line}")
+
+            # Check output directory write permission
+            try:
+                test_file = Path(output_dir) / ".write_test"
+                test_file.touch()
+                test_file.unlink()
+                emit(f"   ✓ Output directory write test: PASSED")
+            except Exception as perm_error:
+                emit(f"   ❌ Output directory write test: FAILED - {perm_error}")
+                error_summary.append(f"Write permission issue: {perm_error}")
+
+            error_output = f"Exit code {return_code}. " + ('\n'.join(error_summary) if error_summary else '\n'.join(output_lines[-10:]))
+        else:
+            error_output = f"Exit code {return_code}. No output captured"
+            emit(f"   📋 No output captured from SocWatch")
+
+        return collection, False, error_output
+
+    def process_all_files(self, input_folder: Path, dry_run: bool = False) -> None:
         """
         Process all SocWatch collections in the input folder.
-        
+
+        Collections are streamed from iter_collections straight into the
+        worker pool, so processing of the first collection starts while the
+        rest of the tree is still being scanned.
+
         Args:
             input_folder: Root folder to process
+            dry_run: Only scan and list the collections, don't process them
         """
-        self.start_time = time.time()
-        collections = self.find_etl_files(input_folder)
-        
-        if not collections:
-            print("❌ No .etl files found to process")
+        self.start_time = time.perf_counter()
+
+        if dry_run:
+            # Materialize for the detailed listing, then stop
+            collections = self.find_etl_files(input_folder)
+            print(f"\n🔎 Dry run: {len(collections)} collection(s) would be processed")
             return
-        
+
         # Show SocWatch command-line information
         print(f"\n🔧 SocWatch Command-Line Information:")
         print("=" * 60)
@@ -686,56 +1092,121 @@ class SocWatchProcessor:
         print(f"📖 Options explanation:")
         print(f"   -i <prefix>  : Input base prefix (for collections, use base name)")
         print(f"   -o <folder>  : Output directory (same as input file location)")
-        print(f"💡 Working directory: Changes to each collection's folder before processing")
+        print(f"💡 Working directory: Each socwatch.exe runs in its collection's folder")
         print(f"🔍 Collection detection: Groups session files by base name (e.g., CataV3)")
         print("=" * 60)
-            
-        print(f"\n🚀 Starting batch processing of {len(collections)} collection(s)...")
+
+        # Determine worker count: explicit --jobs wins, otherwise one worker
+        # per core. The total isn't known up front when streaming, so the
+        # cap against the collection count no longer applies.
+        max_workers = self.jobs if self.jobs else (os.cpu_count() or 1)
+        max_workers = max(1, max_workers)
+
+        print(f"\n🚀 Starting batch processing with {max_workers} parallel job(s)...")
         print("=" * 60)
-        
-        for i, collection in enumerate(collections, 1):
+
+        # With multiple workers each collection's log is buffered and emitted
+        # as one block on completion, so parallel output doesn't interleave.
+        # A single worker keeps streaming live.
+        buffer_logs = max_workers > 1
+
+        def _run_one(numbered: Tuple[int, Dict]) -> Tuple[Dict, bool, Optional[str], Optional[List[str]]]:
+            i, collection = numbered
+            log = [] if buffer_logs else None
+            emit = log.append if log is not None else print
             if collection['is_collection']:
-                print(f"\n[{i}/{len(collections)}] {collection['base_name']} (Collection)")
+                emit(f"\n[{i}] {collection['base_name']} (Collection)")
             else:
-                relative_path = collection['directory'].relative_to(input_folder)
                 filename = collection['files'][0]['filename']
-                print(f"\n[{i}/{len(collections)}] {relative_path / (filename + '.etl')}")
-            self.process_collection(collection)
-            
+                try:
+                    display = collection['directory'].relative_to(input_folder)
+                except ValueError:
+                    # Directory spelled differently from input_folder (e.g.
+                    # symlinks); show it absolute rather than failing the job
+                    display = collection['directory']
+                emit(f"\n[{i}] {display / (filename + '.etl')}")
+            result = self.process_collection(collection, log=log)
+            # Record the outcome here, not in the aggregation loop, so an
+            # interrupted run's final report still counts finished work
+            collection, ok, error = result
+            with self._report_lock:
+                if ok:
+                    self.processed_files.append(collection)
+                else:
+                    self.failed_files.append((collection, error))
+            return result + (log,)
+
+        dispatched = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            try:
+                for collection in self.iter_collections(input_folder):
+                    dispatched += 1
+                    futures.append(executor.submit(_run_one, (dispatched, collection)))
+                # Emit buffered logs as workers finish; this also surfaces
+                # any worker exceptions. Outcomes are recorded by the workers
+                # themselves.
+                for future in as_completed(futures):
+                    _collection, _ok, _error, log = future.result()
+                    if log is not None:
+                        sys.stdout.write('\n'.join(log) + '\n')
+                        sys.stdout.flush()
+            except KeyboardInterrupt:
+                # Without this, the with-block's implicit shutdown(wait=True)
+                # would run every queued collection to completion before the
+                # interrupt could propagate - hours, at 30 minutes each
+                print("\n⚠️  Interrupt received - cancelling queued collections...")
+                self._interrupted = True
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._kill_active_processes()
+                raise
+
+        if not dispatched and not self.processed_files:
+            print("❌ No .etl files found to process")
+            return
+
         self.print_final_report()
     
     def print_final_report(self) -> None:
         """Print final processing report."""
-        end_time = time.time()
+        # perf_counter is monotonic, so the reported duration can't be
+        # skewed by a wall-clock adjustment mid-run
+        end_time = time.perf_counter()
         duration = end_time - self.start_time if self.start_time else 0
         
-        print("\n" + "=" * 60)
-        print("📋 FINAL PROCESSING REPORT")
-        print("=" * 60)
-        
         total_collections = len(self.processed_files) + len(self.failed_files)
         success_rate = (len(self.processed_files) / total_collections * 100) if total_collections > 0 else 0
-        
-        print(f"📊 Total collections processed: {total_collections}")
-        print(f"✅ Successfully processed: {len(self.processed_files)}")
-        print(f"❌ Failed: {len(self.failed_files)}")
-        print(f"📈 Success rate: {success_rate:.1f}%")
-        print(f"⏱️  Total time: {duration:.1f} seconds")
-        
+
+        # Assemble the whole report and emit it with a single stdout write
+        lines = [
+            "",
+            "=" * 60,
+            "📋 FINAL PROCESSING REPORT",
+            "=" * 60,
+            f"📊 Total collections processed: {total_collections}",
+            f"✅ Successfully processed: {len(self.processed_files)}",
+            f"❌ Failed: {len(self.failed_files)}",
+            f"📈 Success rate: {success_rate:.1f}%",
+            f"⏱️  Total time: {duration:.1f} seconds",
+        ]
+
         if self.processed_files:
-            print(f"\n✅ Successfully processed collections:")
+            lines.append("\n✅ Successfully processed collections:")
             for collection in self.processed_files:
-                print(f"   ✓ {collection['base_name']}")
-        
+                lines.append(f"   ✓ {collection['base_name']}")
+
         if self.failed_files:
-            print(f"\n❌ Failed collections:")
+            lines.append("\n❌ Failed collections:")
             for collection, error in self.failed_files:
-                print(f"   ✗ {collection['base_name']}: {error}")
-                
-        print(f"\n🔧 SocWatch Configuration Used:")
-        print(f"   📍 Executable: {self.selected_version}")
-        print(f"   📋 Command pattern: socwatch.exe -i <prefix> -o <output_dir>")
-        print("✨ Processing complete!")
+                lines.append(f"   ✗ {collection['base_name']}: {error}")
+
+        lines.append("\n🔧 SocWatch Configuration Used:")
+        lines.append(f"   📍 Executable: {self.selected_version}")
+        lines.append(f"   📋 Command pattern: socwatch.exe -i <prefix> -o <output_dir>")
+        lines.append("✨ Processing complete!")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
 
 
 def main():
@@ -748,7 +1219,11 @@ def main():
     input_folder = None
     socwatch_dir = None
     output_dir = None
-    
+    jobs = None
+    quiet = False
+    dry_run = False
+    no_timestamps = False
+
     args = sys.argv[1:]  # Remove script name
     i = 0
     
@@ -763,6 +1238,14 @@ def main():
             print("  --cli                         Force CLI mode (no GUI dialogs)")
             print("  --socwatch-dir <path>         Specify SocWatch installation directory")
             print("  -o, --output-dir <path>       Specify output directory (default: same as input)")
+            print("  -q, --quiet                   Suppress the detailed collection listing")
+            print("                                printed by --dry-run")
+            print("  --dry-run                     List detected collections without processing")
+            print("  --no-timestamps               Let socwatch.exe write directly to the")
+            print("                                terminal instead of timestamping its output")
+            print("  --jobs <N>                    Number of collections to process in parallel")
+            print("                                (default: number of CPU cores; within each")
+            print("                                folder, largest collections go first)")
             print("\nModes:")
             print("  python socwatch_pp.py                    # GUI mode - select folder with dialog")
             print("  python socwatch_pp.py <input_folder>     # CLI mode - use specified folder")
@@ -780,6 +1263,15 @@ def main():
         elif arg == '--cli':
             use_gui = False
             print("💻 CLI Mode (forced)")
+
+        elif arg in ['-q', '--quiet']:
+            quiet = True
+
+        elif arg == '--dry-run':
+            dry_run = True
+
+        elif arg == '--no-timestamps':
+            no_timestamps = True
             
         elif arg == '--socwatch-dir':
             if i + 1 >= len(args):
@@ -794,7 +1286,20 @@ def main():
                 sys.exit(1)
             output_dir = Path(args[i + 1])
             i += 1  # Skip next argument as it's the directory path
-            
+
+        elif arg == '--jobs':
+            if i + 1 >= len(args):
+                print("❌ --jobs requires a number")
+                sys.exit(1)
+            try:
+                jobs = int(args[i + 1])
+                if jobs < 1:
+                    raise ValueError
+            except ValueError:
+                print(f"❌ --jobs requires a positive integer, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 1  # Skip next argument as it's the job count
+
         elif arg.startswith('--'):
             print(f"❌ Unknown option: {arg}")
             print("Run 'python socwatch_pp.py --help' for usage information")
@@ -820,7 +1325,10 @@ def main():
     
     # Initialize processor
     processor = SocWatchProcessor(socwatch_base_dir=socwatch_dir, use_gui=use_gui)
-    
+    processor.jobs = jobs
+    processor.quiet = quiet
+    processor.no_timestamps = no_timestamps
+
     # Set custom output directory if provided
     if output_dir:
         processor.custom_output_dir = output_dir
@@ -842,9 +1350,8 @@ def main():
     if not input_folder.exists():
         error_msg = f"Input folder does not exist: {input_folder}"
         if use_gui:
-            if not processor.root:
-                processor.root = tk.Tk()
-                processor.root.withdraw()
+            from tkinter import messagebox
+            processor._ensure_root()
             messagebox.showerror("Folder Not Found", error_msg)
         else:
             print(f"❌ {error_msg}")
@@ -853,9 +1360,8 @@ def main():
     if not input_folder.is_dir():
         error_msg = f"Input path is not a directory: {input_folder}"
         if use_gui:
-            if not processor.root:
-                processor.root = tk.Tk()
-                processor.root.withdraw()
+            from tkinter import messagebox
+            processor._ensure_root()
             messagebox.showerror("Invalid Path", error_msg)
         else:
             print(f"❌ {error_msg}")
@@ -863,8 +1369,8 @@ def main():
         
     print(f"📁 Input folder: {input_folder}")
     
-    # Select SocWatch version
-    if not processor.select_socwatch_version():
+    # Select SocWatch version (not needed for a dry run)
+    if not dry_run and not processor.select_socwatch_version():
         print("❌ No SocWatch version selected. Exiting.")
         sys.exit(1)
         
@@ -875,7 +1381,7 @@ def main():
         # Note: Removed GUI processing dialog due to hanging issues
         # Users will see progress in terminal window
         
-        processor.process_all_files(input_folder)
+        processor.process_all_files(input_folder, dry_run=dry_run)
         
         # Note: Removed GUI completion dialog due to hanging issues
         # Processing results are shown in console output above